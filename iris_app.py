@@ -1,53 +1,164 @@
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
 import streamlit as st
 import pandas as pd
+import numpy as np
 from sklearn.linear_model import LinearRegression, LogisticRegression
-from sklearn.preprocessing import LabelEncoder
+
+# Numba is optional; without it the prediction kernels run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Iris has exactly three species; their index is the encoded label
+CLASSES = ("setosa", "versicolor", "virginica")
+
+DATA_URL = "https://gist.githubusercontent.com/curran/a08a1080b88344b0c8a7/raw/0e7a9b0a5d22642a06d3d5b9bcbad9890c8ee534/iris.csv"
+# Local parquet copy so cold starts skip the download and CSV parsing
+DATA_CACHE = Path(__file__).with_name("iris.parquet")
 
 # Load dataset with error handling
 @st.cache_data
 def load_data():
+    if DATA_CACHE.exists():
+        try:
+            return pd.read_parquet(DATA_CACHE)
+        except Exception:
+            # Drop an unreadable cache and download the data again
+            try:
+                DATA_CACHE.unlink()
+            except OSError:
+                pass
+
     try:
-        url = "https://gist.githubusercontent.com/curran/a08a1080b88344b0c8a7/raw/0e7a9b0a5d22642a06d3d5b9bcbad9890c8ee534/iris.csv"
-        return pd.read_csv(url)
+        df = pd.read_csv(DATA_URL)
     except Exception as e:
         st.error(f"Error loading dataset: {str(e)}")
         return None
 
-df = load_data()
+    # Caching is best effort; write to a temp file and swap it in so an
+    # interrupted write never leaves a broken cache behind
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=DATA_CACHE.parent, prefix="iris.", suffix=".parquet.tmp")
+        os.close(fd)
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, DATA_CACHE)
+    except Exception:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return df
 
-if df is not None:
+# Train models once per process and share them across sessions and reruns
+@st.cache_resource
+def get_models(df):
     # Encode species labels to numbers
-    le = LabelEncoder()
-    df["species_encoded"] = le.fit_transform(df["species"])
+    y = df["species"].map({name: i for i, name in enumerate(CLASSES)}).to_numpy(dtype=np.int32)
 
-    # Prepare features and target
-    X = df[["sepal_length", "sepal_width", "petal_length", "petal_width"]]
-    y = df["species_encoded"]
+    # Prepare features as a float32 array so sklearn does not coerce the DataFrame itself
+    X = df[["sepal_length", "sepal_width", "petal_length", "petal_width"]].to_numpy(dtype=np.float32, copy=False)
 
-    # Initialize models
-    linear_model = LinearRegression()
-    logistic_model = LogisticRegression(max_iter=1000)
-    
     # Train both models
-    linear_model.fit(X, y)
-    logistic_model.fit(X, y)
-
-    with st.sidebar:
-        st.title("👥 Group Members")
-        st.write("""
-        - Atornee O. Maala
-        - Deejay D. Piaoan
-        - Hener P. Lorenzana
-        - Shekeina D. Dabalos
-        - Joseph B. Rosales
-        """)
-        st.title("🔢 SUPERVISED LEARNING MODEL")
-        selected_model = st.radio(
-            "Select Algorithm",
-            ["Linear Regression", "Logistic Regression"],
-            key="model_selection"
-        )
-        st.image("https://miro.medium.com/v2/resize:fit:720/format:webp/1*H2UmG5L1I5bzFCW006N5Ag.png", caption="Iris Dataset")
+    linear_model = LinearRegression().fit(X, y)
+    # Newton-CG converges in a handful of iterations on 150 rows and stays multinomial,
+    # which the softmax below relies on
+    logistic_model = LogisticRegression(solver="newton-cg", tol=1e-3).fit(X, y)
+
+    # Keep the linear coefficients as plain float32 arrays to skip sklearn's per-call validation
+    w = linear_model.coef_.astype(np.float32)
+    b = float(linear_model.intercept_)
+
+    # Likewise for the multinomial logistic model, whose probabilities are a softmax over W @ x + b
+    Wlog = logistic_model.coef_.astype(np.float32)
+    blog = logistic_model.intercept_.astype(np.float32)
+
+    # Fused prediction kernels, defined here so they are JIT-compiled once per process
+    @njit(fastmath=True)
+    def predict_linear(x, w, b):
+        return w[0] * x[0] + w[1] * x[1] + w[2] * x[2] + w[3] * x[3] + b
+
+    @njit(fastmath=True)
+    def predict_logistic(x, W, b):
+        z = b.copy()
+        for k in range(W.shape[0]):
+            for j in range(W.shape[1]):
+                z[k] += W[k, j] * x[j]
+        e = np.exp(z - z.max())
+        return e / e.sum()
+
+    # Compile both kernels up front instead of on the first interaction
+    x0 = np.zeros(4, dtype=np.float32)
+    predict_linear(x0, w, b)
+    predict_logistic(x0, Wlog, blog)
+
+    def predict_linear_fn(x):
+        prediction = float(predict_linear(x, w, b))
+        predicted_class = round(prediction)
+        # Predictions that round outside the known species have no answer
+        if not 0 <= predicted_class < len(CLASSES):
+            return None, None
+        return CLASSES[predicted_class], 1 - abs(prediction - predicted_class)
+
+    def predict_logistic_fn(x):
+        p = predict_logistic(x, Wlog, blog)
+        idx = int(p.argmax())
+        return CLASSES[idx], float(p[idx])
+
+    # Dispatch on the selected algorithm name
+    predictors = {
+        "Linear Regression": predict_linear_fn,
+        "Logistic Regression": predict_logistic_fn,
+    }
+
+    # Memoize predictions; inputs live on a 0.1 grid so the key space stays small
+    @lru_cache(maxsize=4096)
+    def predict(model_name, sepal_length, sepal_width, petal_length, petal_width):
+        # Float32 is ample precision for measurements on a 0.1 cm grid
+        x = np.array((sepal_length, sepal_width, petal_length, petal_width), dtype=np.float32)
+        return predictors[model_name](x)
+
+    # Batched variants for scoring many rows in one matmul
+    def batch_predict_linear(X):
+        return X @ w + b
+
+    def batch_predict_logistic(X):
+        Z = X @ Wlog.T + blog
+        Z -= Z.max(1, keepdims=True)
+        E = np.exp(Z)
+        return E / E.sum(1, keepdims=True)
+
+    return predict, batch_predict_linear, batch_predict_logistic
+
+df = load_data()
+
+# Static sidebar, rendered whether or not the dataset loaded
+with st.sidebar:
+    st.title("👥 Group Members")
+    st.write("""
+    - Atornee O. Maala
+    - Deejay D. Piaoan
+    - Hener P. Lorenzana
+    - Shekeina D. Dabalos
+    - Joseph B. Rosales
+    """)
+    st.title("🔢 SUPERVISED LEARNING MODEL")
+    selected_model = st.radio(
+        "Select Algorithm",
+        ["Linear Regression", "Logistic Regression"],
+        key="model_selection"
+    )
+    st.image("https://miro.medium.com/v2/resize:fit:720/format:webp/1*H2UmG5L1I5bzFCW006N5Ag.png", caption="Iris Dataset")
+
+if df is not None:
+    predict, batch_predict_linear, batch_predict_logistic = get_models(df)
 
     st.title(f"Iris Flower Species Prediction")
     st.markdown("This application uses Machine Learning models to predict the species of an Iris flower based on its dimensions.")
@@ -56,58 +167,58 @@ if df is not None:
     st.markdown(f"### Currently using: {selected_model}")
     st.markdown("Enter the measurements of the Iris flower:")
 
-    col1, col2 = st.columns(2)
-    with col1:
-        sepal_length = st.number_input("Sepal Length (cm)", min_value=0.0, max_value=10.0, value=5.0, step=0.1)
-        sepal_width = st.number_input("Sepal Width (cm)", min_value=0.0, max_value=10.0, value=3.0, step=0.1)
-    with col2:
-        petal_length = st.number_input("Petal Length (cm)", min_value=0.0, max_value=10.0, value=4.0, step=0.1)
-        petal_width = st.number_input("Petal Width (cm)", min_value=0.0, max_value=10.0, value=1.0, step=0.1)
-
-    # Automatically update prediction when inputs change
-    if 'species' not in st.session_state or \
-            st.session_state.sepal_length != sepal_length or \
-            st.session_state.sepal_width != sepal_width or \
-            st.session_state.petal_length != petal_length or \
-            st.session_state.petal_width != petal_width:
-
-        st.session_state.sepal_length = sepal_length
-        st.session_state.sepal_width = sepal_width
-        st.session_state.petal_length = petal_length
-        st.session_state.petal_width = petal_width
+    # Group the inputs in a form so editing them does not rerun the app until submitted
+    with st.form("measurements"):
+        col1, col2 = st.columns(2)
+        with col1:
+            sepal_length = st.number_input("Sepal Length (cm)", min_value=0.0, max_value=10.0, value=5.0, step=0.1)
+            sepal_width = st.number_input("Sepal Width (cm)", min_value=0.0, max_value=10.0, value=3.0, step=0.1)
+        with col2:
+            petal_length = st.number_input("Petal Length (cm)", min_value=0.0, max_value=10.0, value=4.0, step=0.1)
+            petal_width = st.number_input("Petal Width (cm)", min_value=0.0, max_value=10.0, value=1.0, step=0.1)
+        submitted = st.form_submit_button("Predict")
 
-        try:
-            input_data = [[sepal_length, sepal_width, petal_length, petal_width]]
-            
-            if selected_model == "Linear Regression":
-                prediction = linear_model.predict(input_data)[0]
-                predicted_class = round(prediction)
-                species = le.inverse_transform([predicted_class])[0]
-                confidence = 1 - abs(prediction - predicted_class)
-            else:  # Logistic Regression
-                prediction = logistic_model.predict(input_data)[0]
-                proba = logistic_model.predict_proba(input_data)[0]
-                species = le.inverse_transform([prediction])[0]
-                confidence = max(proba)
-
-            st.session_state.species = species
-            st.session_state.confidence = confidence
-        except:
-            st.session_state.species = None
-            st.session_state.confidence = None
+    # Predict on every submit and whenever the model or inputs behind the shown result change;
+    # repeated inputs hit the prediction cache
+    inputs = (sepal_length, sepal_width, petal_length, petal_width)
+    key = (selected_model, *inputs)
+    if submitted or st.session_state.get("inputs") != key:
+        st.session_state.inputs = key
+
+        species, confidence = predict(selected_model, *(round(value, 1) for value in inputs))
+
+        st.session_state.species = species
+        st.session_state.confidence = confidence
 
     # Display prediction result with colored confidence level
     if 'species' in st.session_state and st.session_state.species:
         confidence_percent = st.session_state.confidence * 100
         if confidence_percent >= 80:
-            color = "green"
+            delta_color = "normal"  # green
         elif confidence_percent < 50:
-            color = "red"
+            delta_color = "inverse"  # red
         else:
-            color = "orange"
+            delta_color = "off"  # gray
+
+        st.metric(
+            label="Predicted Species",
+            value=st.session_state.species.capitalize(),
+            delta=f"{confidence_percent:.2f}% confidence",
+            delta_color=delta_color)
+
+    # What-if view: sweep one measurement while holding the others at the entered values.
+    # Gated by a checkbox because Streamlit runs expander bodies even when collapsed.
+    if st.checkbox("Show what-if sweep"):
+        labels = ["Sepal Length (cm)", "Sepal Width (cm)", "Petal Length (cm)", "Petal Width (cm)"]
+        swept = st.selectbox("Measurement to vary", labels)
+        grid = np.arange(101, dtype=np.float32) / 10
+        X_grid = np.tile(np.array(inputs, dtype=np.float32), (grid.size, 1))
+        X_grid[:, labels.index(swept)] = grid
 
-        st.markdown(
-            f"### Predicted Species: **{st.session_state.species.capitalize()}** <span style='color:{color}'>**({confidence_percent:.2f}%)**</span>",
-            unsafe_allow_html=True)
+        if selected_model == "Linear Regression":
+            sweep = pd.DataFrame({"Predicted label": batch_predict_linear(X_grid)}, index=grid)
+        else:  # Logistic Regression
+            sweep = pd.DataFrame(batch_predict_logistic(X_grid), index=grid, columns=CLASSES)
+        st.line_chart(sweep)
 else:
     st.warning("Dataset failed to load. Please check the data source.")
\ No newline at end of file